@@ -1,114 +1,296 @@
+import functools
+import os
+
 import matplotlib.pyplot as plt
 import SimpleITK as sitk
 import cv2
 import numpy as np
-from ipywidgets import interact, FloatSlider, interactive
+from numba import njit, prange
+from IPython.display import display
+from ipywidgets import FloatSlider, IntSlider, interactive
+
+
+# Pixels along one side of a 6 inch axes at 100 dpi; slices larger than this are decimated before display
+_DISPLAY_PX = 600
+
+# Contour colour in the units of the uint8 display buffers (a float-style (0, 1, 0) would be near black)
+_CONTOUR_RGB = np.array([0, 255, 0], dtype=np.uint8)
+
+# numba can only cache compiled kernels next to a real source file; this script is often exec'd or pasted
+# into a notebook instead of imported (its name has a space), in which case caching must stay off
+_NUMBA_CACHE = os.path.isfile((lambda: None).__code__.co_filename)
+
+
+def _blitter(fig, axes, artists):
+    """
+    Return a function that redraws only the given artists over cached axes backgrounds (blitting).
+    Under the inline backend, where figures are static images, it re-displays the whole figure instead.
+
+    * fig : Figure holding the axes.
+    * axes : Sequence of axes whose backgrounds are cached.
+    * artists : For each axes, the list of animated artists to redraw on it.
+    """
+    if 'inline' in plt.get_backend():
+        # The figure cannot be updated in place: show it in the widget output on every update instead,
+        # and close it so it is not also shown at the end of the cell
+        plt.close(fig)
+        return lambda: display(fig)
+
+    backgrounds = []
+
+    def on_draw(event):
+        # Any full draw (first display, resize, ...) invalidates the cached backgrounds
+        backgrounds[:] = [fig.canvas.copy_from_bbox(ax.bbox) for ax in axes]
+        for ax, ax_artists in zip(axes, artists):
+            for artist in ax_artists:
+                ax.draw_artist(artist)
+
+    fig.canvas.mpl_connect('draw_event', on_draw)
+
+    def blit():
+        if not backgrounds:
+            fig.canvas.draw_idle()
+            return
+        # Restore and redraw every axes first, then push the result in a single blit: on web backends
+        # (ipympl) each blit call sends a frame to the browser
+        for background in backgrounds:
+            fig.canvas.restore_region(background)
+        for ax, ax_artists in zip(axes, artists):
+            for artist in ax_artists:
+                ax.draw_artist(artist)
+        fig.canvas.blit(fig.bbox)
+
+    return blit
+
+
+@njit(parallel=True, cache=_NUMBA_CACHE)
+def _minmax_3d(arr):
+    # Per-slab minimum and maximum in parallel, then a final reduction over the slabs
+    mins = np.empty(arr.shape[0])
+    maxs = np.empty(arr.shape[0])
+    for z in prange(arr.shape[0]):
+        lo = hi = arr[z, 0, 0]
+        for y in range(arr.shape[1]):
+            for x in range(arr.shape[2]):
+                val = arr[z, y, x]
+                if val < lo:
+                    lo = val
+                if val > hi:
+                    hi = val
+        mins[z] = lo
+        maxs[z] = hi
+    return mins.min(), maxs.max()
+
+
+@njit(parallel=True, fastmath=True, cache=_NUMBA_CACHE)
+def _rescale_linear_3d(arr, arr_min, scale, new_min, out):
+    for z in prange(arr.shape[0]):
+        for y in range(arr.shape[1]):
+            for x in range(arr.shape[2]):
+                out[z, y, x] = (arr[z, y, x] - arr_min) * scale + new_min
+
+
+def rescale_linear(arr: np.ndarray, new_min: float = 0, new_max: float = 1, dtype=np.float32):
+    """
+    Linearly rescale the values of an array so that its minimum maps to `new_min` and its maximum to `new_max`.
+    3D volumes run as a single parallel pass, writing straight into an array of the requested dtype.
+
+    * arr : Array to rescale, usually a 3D volume.
+    * new_min : Value the minimum of `arr` is mapped to.
+    * new_max : Value the maximum of `arr` is mapped to.
+    * dtype : Data type of the returned array.
+    """
+    # The kernels only accept native byte order (NIfTI data can be big-endian) and numba's numeric types
+    arr = arr.astype(arr.dtype.newbyteorder('='), copy=False)
+    if arr.dtype == np.float16 or arr.dtype == np.bool_:
+        arr = arr.astype(np.float32)
+
+    if arr.ndim != 3:
+        arr_min, arr_max = arr.min(), arr.max()
+        scale = (new_max - new_min) / (arr_max - arr_min) if arr_max > arr_min else 0.0
+        return ((arr - arr_min) * scale + new_min).astype(dtype)
+
+    arr_min, arr_max = _minmax_3d(arr)
+    scale = (new_max - new_min) / (arr_max - arr_min) if arr_max > arr_min else 0.0
+    out = np.empty(arr.shape, dtype=dtype)
+    _rescale_linear_3d(arr, arr_min, scale, new_min, out)
+    return out
+
+
+@njit(parallel=True, cache=_NUMBA_CACHE)
+def _render_contour_slice(image, contours, colour, out):
+    # Expand a uint8 grey slice to RGBA in a single pass over the slice, then paint the contour pixels,
+    # given as flat indices into the slice
+    for y in prange(image.shape[0]):
+        for x in range(image.shape[1]):
+            val = image[y, x]
+            out[y, x, 0] = val
+            out[y, x, 1] = val
+            out[y, x, 2] = val
+            out[y, x, 3] = 255
+    pixels = out.reshape(-1, 4)
+    for i in contours:
+        pixels[i, 0] = colour[0]
+        pixels[i, 1] = colour[1]
+        pixels[i, 2] = colour[2]
+
+
+def _display_stride(shape):
+    """
+    Return the step that decimates a slice down to about the pixels an axes can display.
+
+    * shape : (H, W) shape of the displayed slice.
+    """
+    return max(1, max(shape) // _DISPLAY_PX)
+
+
+def _plane_stacks(arr: np.ndarray, flipud: bool = True):
+    """
+    Return the volume as three C-contiguous stacks, so that indexing axis 0 of each gives the axial, coronal
+    and sagittal slice, already flipped and decimated. The copies are made once, so every update reads
+    a single contiguous block instead of gathering strided slices.
+
+    Each plane is decimated by the stride its own slice shape needs (see `_display_stride`), so volumes of
+    the same shape (image, mask, overlay) always get matching stacks.
+
+    * arr : 3D array with shape (Z, X, Y).
+    * flipud : Flip the coronal and sagittal slices upside down.
+    """
+    coronal = arr.transpose(1, 0, 2)
+    sagittal = arr.transpose(2, 0, 1)
+    if flipud:
+        coronal, sagittal = coronal[:, ::-1, :], sagittal[:, ::-1, :]
+    stacks = []
+    for stack in (arr, coronal, sagittal):
+        stride = _display_stride(stack.shape[1:])
+        stacks.append(np.ascontiguousarray(stack[:, ::stride, ::stride]))
+    return tuple(stacks)
+
+
+def _slice_figure(images, **imshow_kwargs):
+    """
+    Create the axial, coronal and sagittal figure of an explorer once, with its layout solved a single time.
+    Returns a function `update(images, slices)` that swaps the image data and slice labels and blits them.
+
+    * images : Initial axial, coronal and sagittal slices.
+    * imshow_kwargs : Extra keyword arguments passed to `imshow` for every plane (e.g. cmap, vmin, vmax).
+    """
+    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    artists, labels = [], []
+    for ax, image, plane in zip(axes, images, ('Axial', 'Coronal', 'Sagittal')):
+        artists.append(ax.imshow(image, interpolation='nearest', animated=True, **imshow_kwargs))
+        labels.append(ax.text(0.02, 0.98, 'Slice 0', transform=ax.transAxes, color='white', va='top', animated=True))
+        ax.axis('off')
+        ax.set_title(plane)
+    # The axes geometry never changes, so the layout is not solved again on updates
+    fig.tight_layout()
+    blit = _blitter(fig, axes, list(zip(artists, labels)))
+
+    def update(images, slices):
+        for im, label, image, SLICE in zip(artists, labels, images, slices):
+            im.set_data(image)
+            label.set_text(f'Slice {SLICE}')
+        blit()
+
+    return update
 
 
 def explore_3D_array0(arr: np.ndarray, cmap: str = 'gray'):
     """
-    Create interactive widget to visualise 3D slices from the 3D array in axial, coronal, and sagittal planes. 
+    Create interactive widget to visualise 3D slices from the 3D array in axial, coronal, and sagittal planes.
 
     * arr : 3D array with shape (Z, X, Y) that represents the volume of an MRI image.
     * cmap : Color map to use for plotting slices in matplotlib.pyplot.
     """
 
-    def fn(SLICE):
-        # Extract slices for all three planes
-        axial_slice = arr[SLICE, :, :]
-        coronal_slice = np.flipud(arr[:, SLICE, :])
-        sagittal_slice = np.flipud(arr[:, :, SLICE])
-
-        # Display slices side by side
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    # Quantised to uint8 once: a quarter of the bandwidth of float32, with no visible loss through a 256-entry
+    # colormap, and every update is a plain slice of a contiguous stack
+    stacks = _plane_stacks(rescale_linear(arr, 0, 255, dtype=np.uint8))
 
-        axes[0].imshow(axial_slice, cmap=cmap)
-        axes[0].axis('off')
-        axes[0].set_title(f'Axial Slice {SLICE}')
-
-        axes[1].imshow(coronal_slice, cmap=cmap)
-        axes[1].axis('off')
-        axes[1].set_title(f'Coronal Slice {SLICE}')
+    def render(SLICE):
+        # Extract slices for all three planes
+        return tuple(stack[SLICE] for stack in stacks)
 
-        axes[2].imshow(sagittal_slice, cmap=cmap)
-        axes[2].axis('off')
-        axes[2].set_title(f'Sagittal Slice {SLICE}')
+    # The colour range is fixed to the whole (quantised) volume so slices stay comparable
+    update = _slice_figure(render(0), cmap=cmap, vmin=0, vmax=255)
 
-        plt.tight_layout()
-        plt.show()
+    def fn(SLICE):
+        update(render(SLICE), (SLICE, SLICE, SLICE))
 
     # Create the interactive widget with a slice slider
     return interactive(
         fn,
-        SLICE=(0, min(arr.shape) - 1) 
+        SLICE=IntSlider(min=0, max=min(arr.shape) - 1, step=1, value=0, continuous_update=False)
     )
 
 
 def explore_3D_array_with_mask_contour0(arr: np.ndarray, mask: np.ndarray, thickness: int = 1):
     """
-    Create interactive widget to visualise 2D slices from the 3D array in axial, coronal, and sagittal planes. 
+    Create interactive widget to visualise 2D slices from the 3D array in axial, coronal, and sagittal planes.
     Overlay countours of region of interest (cavity and lesion masks)
-    
+
     * arr : 3D array with shape (Z, X, Y) representing the volume (e.g., MRI image).
     * mask : Binary mask with the same shape as `arr`.
-    * thickness : Thickness of the contour lines to overlay.
+    * thickness : Thickness of the contour lines to overlay, in displayed pixels. A negative value (e.g. cv2.FILLED)
+      fills the masked region instead; 0 is not allowed.
     """
     assert arr.shape == mask.shape, "arr and mask must have the same shape"
-
-    _arr = rescale_linear(arr, 0, 1) 
-    _mask = mask.astype(np.uint8)  
+    if thickness == 0:
+        raise ValueError("thickness must be positive, or negative to fill the mask")
+
+    _mask = (mask != 0).astype(np.uint8)
+    axial, coronal, sagittal = _plane_stacks(rescale_linear(arr, 0, 255, dtype=np.uint8))
+    mask_stacks = _plane_stacks(_mask)
+
+    # Contours are returned as flat indices of the pixels to paint
+    if thickness < 0:
+        # Filled, as cv2.drawContours did with cv2.FILLED. Not cached: the indices grow with the mask area
+        def contours(plane, i):
+            return np.flatnonzero(mask_stacks[plane][i])
+    else:
+        # The ring of pixels a dilation adds around the mask: `thickness` displayed pixels wide
+        kernel = np.ones((2 * thickness + 1, 2 * thickness + 1), dtype=np.uint8)
+
+        # The mask does not change for the lifetime of the widget, so rings are cached per plane and slice
+        # index; their indices grow with the outline length only, not with the slice size
+        @functools.lru_cache(maxsize=512)
+        def contours(plane, i):
+            mask = mask_stacks[plane][i]
+            return np.flatnonzero(cv2.dilate(mask, kernel) ^ mask)
+
+    # RGBA buffers for the contoured axial, coronal and sagittal slices, reused on every update
+    rgba = [np.empty((*stack.shape[1:], 4), dtype=np.uint8) for stack in (axial, coronal, sagittal)]
+
+    # Prepare RGBA images with contours
+    def add_contours(image, contours, out):
+        _render_contour_slice(image, contours, _CONTOUR_RGB, out)
+        return out
+
+    def render(axial_SLICE, coronal_SLICE, sagittal_SLICE):
+        # Extract slices for all three planes and render them with their contours
+        axial_contoured = add_contours(axial[axial_SLICE], contours(0, axial_SLICE), rgba[0])
+        coronal_contoured = add_contours(coronal[coronal_SLICE], contours(1, coronal_SLICE), rgba[1])
+        sagittal_contoured = add_contours(sagittal[sagittal_SLICE], contours(2, sagittal_SLICE), rgba[2])
+        return axial_contoured, coronal_contoured, sagittal_contoured
+
+    update = _slice_figure(render(0, 0, 0))
 
     def fn(axial_SLICE, coronal_SLICE, sagittal_SLICE):
-        # Extract slices for all three planes
-        axial_slice = _arr[axial_SLICE, :, :]
-        axial_mask = _mask[axial_SLICE, :, :]
-
-        coronal_slice = np.flipud(_arr[:, coronal_SLICE, :])
-        coronal_mask = np.flipud(_mask[:, coronal_SLICE, :])
-
-        sagittal_slice = np.flipud(_arr[:, :, sagittal_SLICE])
-        sagittal_mask = np.flipud(_mask[:, :, sagittal_SLICE])
-
-        # Prepare RGB images with contours
-        def add_contours(image, mask):
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
-            contours, _ = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-            return cv2.drawContours(image_rgb, contours, -1, (0, 1, 0), thickness)
-               
-        axial_contoured = add_contours(axial_slice, axial_mask)
-        coronal_contoured = add_contours(coronal_slice, coronal_mask)
-        sagittal_contoured = add_contours(sagittal_slice, sagittal_mask)
-
-        # Display images side by side
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-
-        axes[0].imshow(axial_contoured)
-        axes[0].axis('off')
-        axes[0].set_title(f'Axial Slice {axial_SLICE}')
-
-        axes[1].imshow(coronal_contoured)
-        axes[1].axis('off')
-        axes[1].set_title(f'Coronal Slice {coronal_SLICE}')
-
-        axes[2].imshow(sagittal_contoured)
-        axes[2].axis('off')
-        axes[2].set_title(f'Sagittal Slice {sagittal_SLICE}')
-
-        plt.tight_layout()
-        plt.show()
+        slices = (axial_SLICE, coronal_SLICE, sagittal_SLICE)
+        update(render(*slices), slices)
 
     # Create the interactive widget with three slice sliders
     return interactive(
         fn,
-        axial_SLICE=(0, arr.shape[0] - 1),
-        coronal_SLICE=(0, arr.shape[1] - 1),
-        sagittal_SLICE=(0, arr.shape[2] - 1)
+        axial_SLICE=IntSlider(min=0, max=arr.shape[0] - 1, step=1, value=0, continuous_update=False),
+        coronal_SLICE=IntSlider(min=0, max=arr.shape[1] - 1, step=1, value=0, continuous_update=False),
+        sagittal_SLICE=IntSlider(min=0, max=arr.shape[2] - 1, step=1, value=0, continuous_update=False)
     )
 
 
 def explore_3D_array_comparison0 (arr_before: np.ndarray, arr_after: np.ndarray, cmap: str = 'gray'):
     """
-    Create an interactive widget to explore and compare slices across all planes (axial, sagittal, coronal) 
+    Create an interactive widget to explore and compare slices across all planes (axial, sagittal, coronal)
     of 3D arrays representing MRI volumes before and after transformations.
 
     * arr_before : 3D array with shape (Z, X, Y) that represents the volume of an MRI image, before any transform.
@@ -116,37 +298,44 @@ def explore_3D_array_comparison0 (arr_before: np.ndarray, arr_after: np.ndarray,
     * cmap : Colormap to use for plotting slices in matplotlib.pyplot.
     """
     assert arr_after.shape == arr_before.shape
-    
+
+    # Axial, sagittal (X-axis) and coronal (Y-axis) stacks, in the original orientation
+    stacks_before = _plane_stacks(rescale_linear(arr_before, 0, 255, dtype=np.uint8), flipud=False)
+    stacks_after = _plane_stacks(rescale_linear(arr_after, 0, 255, dtype=np.uint8), flipud=False)
+
+    def render(stacks, slice_idx):
+        return tuple(stack[slice_idx] for stack in stacks)
+
+    columns = ((stacks_before, 'Before'), (stacks_after, 'After'))
+    planes = ('Axial', 'Sagittal', 'Coronal')
+
+    # Create the figure once with 6 persistent images, ims[row][col]; the slider only swaps their data
+    fig, axes = plt.subplots(3, 2, figsize=(12, 18))
+    ims = [[None, None] for _ in planes]
+    for col, (stacks, stage) in enumerate(columns):
+        for row, (image, plane) in enumerate(zip(render(stacks, 0), planes)):
+            ims[row][col] = axes[row, col].imshow(image, cmap=cmap, vmin=0, vmax=255, interpolation='nearest', animated=True)
+            axes[row, col].set_title(f"{plane} - {stage}", fontsize=12)
+
+    # Adjust layout once; the axes geometry never changes
+    for ax in axes.flatten():
+        ax.axis("off")
+
+    fig.tight_layout()
+    blit = _blitter(fig, axes.flatten(), [[im] for row in ims for im in row])
+
     def fn(slice_idx: int):
-        fig, axes = plt.subplots(3, 2, figsize=(12, 18))
-        
-        # Axial plane (Z-axis)
-        axes[0, 0].imshow(arr_before[slice_idx, :, :], cmap=cmap)
-        axes[0, 0].set_title("Axial - Before", fontsize=12)
-        axes[0, 1].imshow(arr_after[slice_idx, :, :], cmap=cmap)
-        axes[0, 1].set_title("Axial - After", fontsize=12)
-        
-        # Sagittal plane (X-axis)
-        axes[1, 0].imshow(arr_before[:, slice_idx, :], cmap=cmap)
-        axes[1, 0].set_title("Sagittal - Before", fontsize=12)
-        axes[1, 1].imshow(arr_after[:, slice_idx, :], cmap=cmap)
-        axes[1, 1].set_title("Sagittal - After", fontsize=12)
-        
-        # Coronal plane (Y-axis)
-        axes[2, 0].imshow(arr_before[:, :, slice_idx], cmap=cmap)
-        axes[2, 0].set_title("Coronal - Before", fontsize=12)
-        axes[2, 1].imshow(arr_after[:, :, slice_idx], cmap=cmap)
-        axes[2, 1].set_title("Coronal - After", fontsize=12)
-        
-        # Adjust layout
-        for ax in axes.flatten():
-            ax.axis("off")
-        
-        plt.tight_layout()
-        plt.show()
-
-    interact(fn, 
-             slice_idx=widgets.IntSlider(min=0, max=arr_before.shape[0]-1, step=1, value=0, description='Slice'))
+        for col, (stacks, _) in enumerate(columns):
+            for row, image in enumerate(render(stacks, slice_idx)):
+                ims[row][col].set_data(image)
+        blit()
+
+    # The same index is used along every axis, so the slider stops at the shortest one
+    return interactive(
+        fn,
+        slice_idx=IntSlider(min=0, max=min(arr_before.shape) - 1, step=1, value=0, description='Slice',
+                            continuous_update=False)
+    )
 
 
 def explore_3D_array_with_transparent_overlay(arr: np.ndarray, overlay: np.ndarray, transparency: float = 0.5):
@@ -159,53 +348,38 @@ def explore_3D_array_with_transparent_overlay(arr: np.ndarray, overlay: np.ndarr
     """
     assert arr.shape == overlay.shape
 
-    _arr = rescale_linear(arr, 0, 1)  
-    _overlay = rescale_linear(overlay, 0, 1) 
+    axial, coronal, sagittal = _plane_stacks(rescale_linear(arr, 0, 255, dtype=np.uint8))
+    axial_overlay, coronal_overlay, sagittal_overlay = _plane_stacks(rescale_linear(overlay, 0, 255, dtype=np.uint8))
 
-    def fn(axial_SLICE, coronal_SLICE, sagittal_SLICE, transparency):
-        # Extract slices for all three planes
-        axial_slice = _arr[axial_SLICE, :, :]
-        axial_overlay = _overlay[axial_SLICE, :, :]
-
-        coronal_slice = np.flipud(_arr[:, coronal_SLICE, :])
-        coronal_overlay = np.flipud(_overlay[:, coronal_SLICE, :])
-
-        sagittal_slice = np.flipud(_arr[:, :, sagittal_SLICE])
-        sagittal_overlay = np.flipud(_overlay[:, :, sagittal_SLICE])
-
-        # Prepare RGB images for display
-        def blend_images(base, overlay, transparency):
-            base_rgb = cv2.cvtColor(base, cv2.COLOR_GRAY2RGB)
-            overlay_rgb = cv2.cvtColor(overlay, cv2.COLOR_GRAY2RGB)
-            return cv2.addWeighted(base_rgb, 1 - transparency, overlay_rgb, transparency, 0)
+    # Scratch buffers for the blended axial, coronal and sagittal slices, reused on every update
+    scratch = [np.empty(stack.shape[1:], dtype=np.float32) for stack in (axial, coronal, sagittal)]
 
-        axial_blended = blend_images(axial_slice, axial_overlay, transparency)
-        coronal_blended = blend_images(coronal_slice, coronal_overlay, transparency)
-        sagittal_blended = blend_images(sagittal_slice, sagittal_overlay, transparency)
+    # Blend the uint8 slices in place as base + transparency * (overlay - base); displayed with a grey colormap
+    def blend_images(base, overlay, transparency, out):
+        np.subtract(overlay, base, out=out, dtype=np.float32)
+        out *= transparency
+        out += base
+        return out
 
-        # Display images side by side
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    def render(axial_SLICE, coronal_SLICE, sagittal_SLICE, transparency):
+        # Extract slices for all three planes and blend them
+        axial_blended = blend_images(axial[axial_SLICE], axial_overlay[axial_SLICE], transparency, scratch[0])
+        coronal_blended = blend_images(coronal[coronal_SLICE], coronal_overlay[coronal_SLICE], transparency, scratch[1])
+        sagittal_blended = blend_images(sagittal[sagittal_SLICE], sagittal_overlay[sagittal_SLICE], transparency, scratch[2])
+        return axial_blended, coronal_blended, sagittal_blended
 
-        axes[0].imshow(axial_blended)
-        axes[0].axis('off')
-        axes[0].set_title(f'Axial Slice {axial_SLICE}')
+    update = _slice_figure(render(0, 0, 0, transparency), cmap='gray', vmin=0, vmax=255)
 
-        axes[1].imshow(coronal_blended)
-        axes[1].axis('off')
-        axes[1].set_title(f'Coronal Slice {coronal_SLICE}')
-
-        axes[2].imshow(sagittal_blended)
-        axes[2].axis('off')
-        axes[2].set_title(f'Sagittal Slice {sagittal_SLICE}')
-
-        plt.tight_layout()
-        plt.show()
+    def fn(axial_SLICE, coronal_SLICE, sagittal_SLICE, transparency):
+        slices = (axial_SLICE, coronal_SLICE, sagittal_SLICE)
+        update(render(*slices, transparency), slices)
 
     # Create the interactive widget with three slice sliders and transparency slider
     return interactive(
         fn,
-        axial_SLICE=(0, arr.shape[0] - 1),
-        coronal_SLICE=(0, arr.shape[1] - 1),
-        sagittal_SLICE=(0, arr.shape[2] - 1),
-        transparency=FloatSlider(value=transparency, min=0, max=1, step=0.01, description='Transparency:')
+        axial_SLICE=IntSlider(min=0, max=arr.shape[0] - 1, step=1, value=0, continuous_update=False),
+        coronal_SLICE=IntSlider(min=0, max=arr.shape[1] - 1, step=1, value=0, continuous_update=False),
+        sagittal_SLICE=IntSlider(min=0, max=arr.shape[2] - 1, step=1, value=0, continuous_update=False),
+        transparency=FloatSlider(value=transparency, min=0, max=1, step=0.01, description='Transparency:',
+                                 continuous_update=False)
     )
\ No newline at end of file